@@ -2,28 +2,26 @@ const express = require('express');
 const fs = require('fs').promises;
 const fsSync = require('fs');
 const path = require('path');
-const cors = require('cors');
+const cluster = require('cluster');
 
 const app = express();
 
 const CONFIG_FILE = 'homelab_services.json';
 const TABS_CONFIG_FILE = 'homelab_tabs.json';
 const IP_WHITELIST_FILE = 'ip_whitelist.json';
-const DEFAULT_SERVICES = [];
+const DEFAULT_SERVICES = Object.freeze([]);
 const DEFAULT_TABS = [{ id: 'default', name: 'Default' }];
 const DEFAULT_IP_WHITELIST = ['127.0.0.1', '::1'];
 
 // Load IP whitelist
 function loadIPWhitelist() {
     try {
-        if (fsSync.existsSync(IP_WHITELIST_FILE)) {
-            const data = JSON.parse(fsSync.readFileSync(IP_WHITELIST_FILE, 'utf8'));
-            return data.allowed_ips || DEFAULT_IP_WHITELIST;
-        } else {
-            return DEFAULT_IP_WHITELIST;
-        }
+        const data = JSON.parse(fsSync.readFileSync(IP_WHITELIST_FILE, 'utf8'));
+        return data.allowed_ips || DEFAULT_IP_WHITELIST;
     } catch (e) {
-        console.error(`Error loading IP whitelist: ${e}`);
+        if (e.code !== 'ENOENT') {
+            console.error(`Error loading IP whitelist: ${e}`);
+        }
         return DEFAULT_IP_WHITELIST;
     }
 }
@@ -46,12 +44,50 @@ app.use((req, res, next) => {
     }
 });
 
+// The favicon never changes at runtime: read it once, answer it before the
+// body parsers and CORS run, and let browsers cache it for good
+const FAVICON = fsSync.readFileSync(path.join(__dirname, 'static', 'favicon.svg'));
+app.get('/favicon.ico', (req, res) => {
+    res.set({
+        'Content-Type': 'image/svg+xml',
+        'Cache-Control': 'public, max-age=31536000, immutable'
+    }).send(FAVICON);
+});
+
 app.use(express.json());
-app.use(express.urlencoded({ extended: true }));
-app.use(cors({
-    origin: process.env.ALLOWED_ORIGINS?.split(',') || ['http://localhost:80', 'http://127.0.0.1:80', 'http://localhost:3000', 'http://127.0.0.1:3000'],
-    credentials: true
-}));
+
+// CORS with every constant header value built once at startup. Preflights are
+// answered here with an empty 204 and never reach the routes.
+const ALLOWED_ORIGINS = new Set(process.env.ALLOWED_ORIGINS?.split(',') || ['http://localhost:80', 'http://127.0.0.1:80', 'http://localhost:3000', 'http://127.0.0.1:3000']);
+const CORS_HEADERS = {
+    'Access-Control-Allow-Credentials': 'true',
+    'Vary': 'Origin'
+};
+const CORS_PREFLIGHT_HEADERS = {
+    ...CORS_HEADERS,
+    'Access-Control-Allow-Methods': 'GET,HEAD,PUT,PATCH,POST,DELETE',
+    'Content-Length': '0'
+};
+app.use((req, res, next) => {
+    const origin = req.headers.origin;
+    const preflight = req.method === 'OPTIONS';
+    
+    res.set(preflight ? CORS_PREFLIGHT_HEADERS : CORS_HEADERS);
+    if (ALLOWED_ORIGINS.has(origin)) {
+        res.set('Access-Control-Allow-Origin', origin);
+    }
+    if (!preflight) {
+        return next();
+    }
+    
+    const requestHeaders = req.headers['access-control-request-headers'];
+    if (requestHeaders) {
+        res.set('Access-Control-Allow-Headers', requestHeaders);
+        res.set('Vary', 'Origin, Access-Control-Request-Headers');
+    }
+    res.status(204).end();
+});
+
 app.use('/static', express.static('static'));
 app.use(express.static('static'));
 
@@ -63,56 +99,260 @@ app.engine('html', (filePath, options, callback) => {
     });
 });
 
-async function loadServices(tabId = 'default') {
+// Pending write per file. Writes to the same file are chained so they never
+// share the temp file and land in call order; reads are served from memory and
+// never wait on them.
+const fileWriteQueues = new Map();
+
+// Gives every write its own temp file, so concurrent saves of the same file
+// never write into each other's
+let tmpFileCounter = 0;
+
+// Serialize once and write the whole payload in a single call. The data goes
+// to a temp file that is fsynced and renamed over the target, so a crash
+// mid-write never leaves a truncated config behind. Config files are written
+// compact; pass pretty for files people are expected to open.
+function writeJsonFile(file, data, { pretty = false } = {}) {
+    const payload = pretty ? JSON.stringify(data, null, 2) : JSON.stringify(data);
+    const previous = fileWriteQueues.get(file) || Promise.resolve();
+    const write = previous.catch(() => {}).then(() => replaceFile(file, payload));
+    fileWriteQueues.set(file, write);
+    
+    const cleanup = () => {
+        if (fileWriteQueues.get(file) === write) {
+            fileWriteQueues.delete(file);
+        }
+    };
+    write.then(cleanup, cleanup);
+    return write;
+}
+
+async function replaceFile(file, payload) {
+    const tmpFile = `${file}.${process.pid}.${++tmpFileCounter}.tmp`;
     try {
-        const configFile = tabId === 'default' ? CONFIG_FILE : `homelab_services_${tabId}.json`;
-        if (fsSync.existsSync(configFile)) {
-            const data = JSON.parse(await fs.readFile(configFile, 'utf8'));
-            const services = [];
-            for (const service of data.services || []) {
-                if (!service.column) {
-                    service.column = 0;
-                }
-                services.push(service);
+        const handle = await fs.open(tmpFile, 'w');
+        try {
+            await handle.writeFile(payload);
+            await handle.sync();
+        } finally {
+            await handle.close();
+        }
+        await fs.rename(tmpFile, file);
+    } catch (e) {
+        // Don't leave a half-written temp file next to the config
+        await fs.unlink(tmpFile).catch(() => {});
+        throw e;
+    }
+}
+
+// Error responses that never vary, serialized once at startup
+function cannedError(status, error) {
+    const body = Buffer.from(JSON.stringify({ success: false, error: error }));
+    return res => res.status(status).type('json').send(body);
+}
+
+const sendInvalidRequestData = cannedError(400, 'Invalid request data');
+const sendInvalidBackupFilename = cannedError(400, 'Invalid backup filename');
+const sendBackupNotFound = cannedError(404, 'Backup file not found');
+const sendTabNotFound = cannedError(404, 'Tab not found');
+const sendServiceNotFound = cannedError(404, 'Service not found');
+const sendEndpointNotFound = cannedError(404, 'Endpoint not found');
+const sendInternalError = cannedError(500, 'Internal server error');
+
+// Parsed services per tab, keyed on the config file's version so repeated
+// reads skip the disk read and JSON parse until the file changes. Cached lists
+// are frozen and handed out as-is; callers that edit a list build a new one.
+const servicesCache = new Map();
+
+// Identifies one version of a config file. mtime alone can miss back-to-back
+// writes that land in the same clock tick, but every save renames a new file
+// into place, so the inode changes even when mtime and size don't.
+function fileVersion(stats) {
+    return `${stats.ino}:${stats.mtimeNs}:${stats.size}`;
+}
+
+function freezeServices(services) {
+    services.forEach(Object.freeze);
+    return Object.freeze(services);
+}
+
+function servicesConfigFile(tabId) {
+    return tabId === 'default' ? CONFIG_FILE : `homelab_services_${tabId}.json`;
+}
+
+// Pending writes for tabs whose latest services only live in servicesCache so
+// far (entries with a null version), as { timer, services }. Rapid edits reset
+// the timer and coalesce into a single disk write; a failed write keeps the
+// edit in memory and is retried.
+const pendingServiceFlushes = new Map();
+const SERVICES_FLUSH_DELAY_MS = 500;
+const SERVICES_FLUSH_RETRY_MS = 5000;
+const REORDER_FLUSH_DELAY_MS = 300;
+
+function scheduleServicesFlush(services, tabId = 'default', delay = SERVICES_FLUSH_DELAY_MS) {
+    cancelServicesFlush(tabId);
+    servicesCache.set(tabId, { version: null, services: freezeServices(services) });
+    pendingServiceFlushes.set(tabId, {
+        timer: setTimeout(() => saveServices(services, tabId, { retryOnFailure: true }), delay),
+        services: services
+    });
+}
+
+// Saves an edit that the client doesn't need to wait on. In a single process it
+// is debounced; cluster workers write it straight through, since other workers
+// can't see an edit that only lives in this worker's memory.
+async function saveServicesDeferred(services, tabId = 'default', delay = SERVICES_FLUSH_DELAY_MS) {
+    if (cluster.isWorker) {
+        return saveServices(services, tabId);
+    }
+    scheduleServicesFlush(services, tabId, delay);
+    return true;
+}
+
+function cancelServicesFlush(tabId) {
+    clearTimeout(pendingServiceFlushes.get(tabId)?.timer);
+    pendingServiceFlushes.delete(tabId);
+}
+
+// Writes out debounced edits and waits for every write already in progress,
+// including saves whose timer has fired and are no longer pending
+async function flushPendingServices() {
+    await Promise.all([...pendingServiceFlushes].map(
+        ([tabId, pending]) => saveServices(pending.services, tabId)
+    ));
+    await Promise.allSettled([...fileWriteQueues.values()]);
+}
+
+// Returns the servicesCache entry for a tab, refreshing it from disk when the
+// file changed, or null when the tab has no readable config
+async function loadServicesEntry(tabId) {
+    const cached = servicesCache.get(tabId);
+    if (cached && cached.version === null) {
+        return cached;
+    }
+    
+    try {
+        const configFile = servicesConfigFile(tabId);
+        const version = fileVersion(await fs.stat(configFile, { bigint: true }));
+        if (cached && cached.version === version) {
+            return cached;
+        }
+        
+        const data = JSON.parse(await fs.readFile(configFile, 'utf8'));
+        const services = [];
+        for (const service of data.services || []) {
+            if (!service.column) {
+                service.column = 0;
             }
-            return services;
-        } else {
-            return DEFAULT_SERVICES;
+            services.push(service);
         }
+        const entry = { version: version, services: freezeServices(services) };
+        
+        // A save or debounced edit may have replaced the entry while we were
+        // reading; never let this (possibly older) disk copy overwrite it
+        const current = servicesCache.get(tabId);
+        if (current !== cached) {
+            return current && current.version === null ? current : entry;
+        }
+        servicesCache.set(tabId, entry);
+        return entry;
     } catch (e) {
-        console.error(`Error loading services for tab ${tabId}: ${e}`);
-        return DEFAULT_SERVICES;
+        if (e.code !== 'ENOENT') {
+            console.error(`Error loading services for tab ${tabId}: ${e}`);
+        }
+        return null;
+    }
+}
+
+async function loadServices(tabId = 'default') {
+    const entry = await loadServicesEntry(tabId);
+    return entry ? entry.services : DEFAULT_SERVICES;
+}
+
+// GET /api/services body for a tab, serialized once per cached services list
+async function loadServicesResponse(tabId = 'default') {
+    const entry = await loadServicesEntry(tabId) || { services: DEFAULT_SERVICES };
+    if (!entry.response) {
+        entry.response = Buffer.from(JSON.stringify({
+            success: true,
+            services: entry.services,
+            count: entry.services.length,
+            tab: tabId
+        }));
     }
+    return entry.response;
+}
+
+// config_exists as reported by /api/health. Successful saves of the default
+// tab set it directly; otherwise it is re-checked on disk at most once a second.
+const CONFIG_EXISTS_TTL_MS = 1000;
+let configExists = false;
+let configExistsCheckedAt = -Infinity;
+
+function configFileExists() {
+    const now = Date.now();
+    if (now - configExistsCheckedAt >= CONFIG_EXISTS_TTL_MS) {
+        configExists = fsSync.existsSync(CONFIG_FILE);
+        configExistsCheckedAt = now;
+    }
+    return configExists;
 }
 
 async function loadTabs() {
     try {
-        if (fsSync.existsSync(TABS_CONFIG_FILE)) {
-            const data = JSON.parse(await fs.readFile(TABS_CONFIG_FILE, 'utf8'));
-            return data.tabs || DEFAULT_TABS;
-        } else {
-            return DEFAULT_TABS;
-        }
+        const data = JSON.parse(await fs.readFile(TABS_CONFIG_FILE, 'utf8'));
+        return data.tabs || DEFAULT_TABS;
     } catch (e) {
-        console.error(`Error loading tabs: ${e}`);
+        if (e.code !== 'ENOENT') {
+            console.error(`Error loading tabs: ${e}`);
+        }
         return DEFAULT_TABS;
     }
 }
 
-async function saveServices(services, tabId = 'default') {
+// Services for every tab keyed by tab id, with the tabs loaded concurrently
+async function loadAllServices(tabs) {
+    const tabServices = await Promise.all(tabs.map(tab => loadServices(tab.id)));
+    const allServices = {};
+    tabs.forEach((tab, i) => {
+        allServices[tab.id] = tabServices[i];
+    });
+    return allServices;
+}
+
+async function saveServices(services, tabId = 'default', { retryOnFailure = false } = {}) {
+    cancelServicesFlush(tabId);
+    // Serve these services from memory while the write is in flight
+    const entry = { version: null, services: freezeServices(services) };
+    servicesCache.set(tabId, entry);
+    let saved = false;
     try {
-        const configFile = tabId === 'default' ? CONFIG_FILE : `homelab_services_${tabId}.json`;
+        const configFile = servicesConfigFile(tabId);
         
         const data = {
             services: services,
             last_updated: new Date().toISOString()
         };
         
-        await fs.writeFile(configFile, JSON.stringify(data, null, 2));
+        await writeJsonFile(configFile, data);
+        if (configFile === CONFIG_FILE) {
+            configExists = true;
+        }
+        saved = true;
         return true;
     } catch (e) {
         console.error(`Error saving services for tab ${tabId}: ${e}`);
         return false;
+    } finally {
+        // Leave any newer edit made during the write in place. A debounced edit
+        // has already been reported as done, so keep it and try again later.
+        if (servicesCache.get(tabId) === entry) {
+            if (!saved && retryOnFailure) {
+                scheduleServicesFlush(services, tabId, SERVICES_FLUSH_RETRY_MS);
+            } else {
+                servicesCache.delete(tabId);
+            }
+        }
     }
 }
 
@@ -123,7 +363,7 @@ async function saveTabs(tabs) {
             last_updated: new Date().toISOString()
         };
         
-        await fs.writeFile(TABS_CONFIG_FILE, JSON.stringify(data, null, 2));
+        await writeJsonFile(TABS_CONFIG_FILE, data);
         return true;
     } catch (e) {
         console.error(`Error saving tabs: ${e}`);
@@ -154,13 +394,7 @@ app.get('/api/tabs', async (req, res) => {
 app.get('/api/services', async (req, res) => {
     try {
         const tabId = req.query.tab || 'default';
-        const services = await loadServices(tabId);
-        res.json({
-            success: true,
-            services: services,
-            count: services.length,
-            tab: tabId
-        });
+        res.type('json').send(await loadServicesResponse(tabId));
     } catch (e) {
         res.status(500).json({
             success: false,
@@ -238,34 +472,29 @@ app.post('/api/services', async (req, res) => {
         
         const services = data.services;
         
-        for (let i = 0; i < services.length; i++) {
-            const service = services[i];
-            const requiredFields = ['name', 'url'];
+        for (const service of services) {
+            const { name, url, column } = service;
             
-            for (const field of requiredFields) {
-                if (!service[field] || !service[field].trim()) {
-                    return res.status(400).json({
-                        success: false,
-                        error: `Service "${service.name || 'Unknown'}": ${field} is required and cannot be empty`
-                    });
-                }
+            // Check the two required fields inline, stopping at the first bad row
+            const missingField = !name || !name.trim() ? 'name' : !url || !url.trim() ? 'url' : null;
+            if (missingField) {
+                return res.status(400).json({
+                    success: false,
+                    error: `Service "${name || 'Unknown'}": ${missingField} is required and cannot be empty`
+                });
             }
             
             // Validate URL format
             try {
-                new URL(service.url.startsWith('http') ? service.url : `http://${service.url}`);
+                new URL(url.startsWith('http') ? url : `http://${url}`);
             } catch {
                 return res.status(400).json({
                     success: false,
-                    error: `Service "${service.name}": Invalid URL format. Please include http:// or https://`
+                    error: `Service "${name}": Invalid URL format. Please include http:// or https://`
                 });
             }
             
-            if (!service.column) {
-                service.column = 0;
-            } else {
-                service.column = Math.max(0, Math.min(2, parseInt(service.column)));
-            }
+            service.column = column ? Math.max(0, Math.min(2, parseInt(column))) : 0;
             
             if (!service.description) {
                 service.description = '';
@@ -311,10 +540,7 @@ app.put('/api/tabs/:tabId', async (req, res) => {
         const tab = tabs.find(t => t.id === tabId);
         
         if (!tab) {
-            return res.status(404).json({
-                success: false,
-                error: 'Tab not found'
-            });
+            return sendTabNotFound(res);
         }
         
         tab.name = data.name.trim();
@@ -355,19 +581,23 @@ app.delete('/api/tabs/:tabId', async (req, res) => {
         const tabIndex = tabs.findIndex(t => t.id === tabId);
         
         if (tabIndex === -1) {
-            return res.status(404).json({
-                success: false,
-                error: 'Tab not found'
-            });
+            return sendTabNotFound(res);
         }
         
         const deletedTab = tabs.splice(tabIndex, 1)[0];
         
-        // Delete the services file for this tab
-        const configFile = `homelab_services_${tabId}.json`;
+        // Delete the services file for this tab, once any write to it that is
+        // already running has finished so it can't recreate the file
+        cancelServicesFlush(tabId);
+        const configFile = servicesConfigFile(tabId);
+        while (fileWriteQueues.has(configFile)) {
+            await fileWriteQueues.get(configFile).catch(() => {});
+            cancelServicesFlush(tabId);
+        }
         if (fsSync.existsSync(configFile)) {
             await fs.unlink(configFile);
         }
+        servicesCache.delete(tabId);
         
         const success = await saveTabs(tabs);
         
@@ -396,15 +626,12 @@ app.delete('/api/services/:serviceId', async (req, res) => {
         const tabId = req.query.tab || 'default';
         const services = await loadServices(tabId);
         
-        if (serviceId < 0 || serviceId >= services.length) {
-            return res.status(404).json({
-                success: false,
-                error: 'Service not found'
-            });
+        if (!(serviceId >= 0 && serviceId < services.length)) {
+            return sendServiceNotFound(res);
         }
         
-        const deletedService = services.splice(serviceId, 1)[0];
-        const success = await saveServices(services, tabId);
+        const deletedService = services[serviceId];
+        const success = await saveServicesDeferred(services.filter((_, i) => i !== serviceId), tabId);
         
         if (success) {
             res.json({
@@ -430,15 +657,13 @@ app.post('/api/services/reorder', async (req, res) => {
         const tabId = req.query.tab || 'default';
         const data = req.body;
         
-        if (!data || !data.services) {
-            return res.status(400).json({
-                success: false,
-                error: 'Invalid request data'
-            });
+        if (!data || !Array.isArray(data.services)) {
+            return sendInvalidRequestData(res);
         }
         
-        const services = data.services;
-        const success = await saveServices(services, tabId);
+        // Drag and drop sends a reorder per move; only the last one in a burst
+        // is written to disk
+        const success = await saveServicesDeferred(data.services, tabId, REORDER_FLUSH_DELAY_MS);
         
         if (success) {
             res.json({
@@ -481,7 +706,7 @@ app.post('/api/services/:serviceId/move', async (req, res) => {
         // Load services from source tab
         const sourceServices = await loadServices(fromTab);
         
-        if (serviceId < 0 || serviceId >= sourceServices.length) {
+        if (!(serviceId >= 0 && serviceId < sourceServices.length)) {
             return res.status(404).json({
                 success: false,
                 error: 'Service not found in source tab'
@@ -489,17 +714,15 @@ app.post('/api/services/:serviceId/move', async (req, res) => {
         }
         
         // Remove service from source tab
-        const [movedService] = sourceServices.splice(serviceId, 1);
+        const movedService = sourceServices[serviceId];
+        const remainingServices = sourceServices.filter((_, i) => i !== serviceId);
         
         // Load services from destination tab
         const destServices = await loadServices(toTab);
         
-        // Add service to destination tab
-        destServices.push(movedService);
-        
-        // Save both tabs
-        const sourceSuccess = await saveServices(sourceServices, fromTab);
-        const destSuccess = await saveServices(destServices, toTab);
+        // Save both tabs, adding the service to the destination
+        const sourceSuccess = await saveServices(remainingServices, fromTab);
+        const destSuccess = await saveServices([...destServices, movedService], toTab);
         
         if (sourceSuccess && destSuccess) {
             res.json({
@@ -526,12 +749,7 @@ app.post('/api/services/:serviceId/move', async (req, res) => {
 app.get('/api/export/all', async (req, res) => {
     try {
         const tabs = await loadTabs();
-        const allServices = {};
-        
-        // Load services for each tab
-        for (const tab of tabs) {
-            allServices[tab.id] = await loadServices(tab.id);
-        }
+        const allServices = await loadAllServices(tabs);
         
         res.json({
             success: true,
@@ -636,25 +854,31 @@ app.post('/api/import/all', async (req, res) => {
     }
 });
 
-app.get('/api/health', async (req, res) => {
-    res.json({
-        status: 'healthy',
-        timestamp: new Date().toISOString(),
-        config_file: CONFIG_FILE,
-        config_exists: fsSync.existsSync(CONFIG_FILE)
-    });
+// /api/health body, rebuilt at most once a second, so the timestamp has
+// one-second granularity
+const HEALTH_BODY_TTL_MS = 1000;
+let healthBody = null;
+let healthBodyBuiltAt = -Infinity;
+
+app.get('/api/health', (req, res) => {
+    const now = Date.now();
+    if (now - healthBodyBuiltAt >= HEALTH_BODY_TTL_MS) {
+        healthBody = Buffer.from(JSON.stringify({
+            status: 'healthy',
+            timestamp: new Date(now).toISOString(),
+            config_file: CONFIG_FILE,
+            config_exists: configFileExists()
+        }));
+        healthBodyBuiltAt = now;
+    }
+    res.type('json').send(healthBody);
 });
 
 app.post('/api/backup', async (req, res) => {
     try {
         // Create full backup including all tabs and services
         const tabs = await loadTabs();
-        const allServices = {};
-        
-        // Load services for each tab
-        for (const tab of tabs) {
-            allServices[tab.id] = await loadServices(tab.id);
-        }
+        const allServices = await loadAllServices(tabs);
         
         const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
         const backupName = `homelab_backup_${timestamp}.json`;
@@ -681,7 +905,7 @@ app.post('/api/backup', async (req, res) => {
             version: '1.0'
         };
         
-        await fs.writeFile(backupName, JSON.stringify(backupData, null, 2));
+        await writeJsonFile(backupName, backupData, { pretty: true });
         
         res.json({
             success: true,
@@ -698,6 +922,41 @@ app.post('/api/backup', async (req, res) => {
     }
 });
 
+// Backups opened at once while building the backup list
+const BACKUP_READ_BATCH_SIZE = 16;
+
+// Summary of one backup for GET /api/backups, stat and read through a single
+// open handle. Returns null if the file was removed since it was listed.
+async function readBackupSummary(backupFile) {
+    let handle;
+    try {
+        handle = await fs.open(backupFile, 'r');
+    } catch (e) {
+        if (e.code === 'ENOENT') {
+            return null;
+        }
+        throw e;
+    }
+    let stats, backupData;
+    try {
+        stats = await handle.stat();
+        backupData = JSON.parse(await handle.readFile('utf8'));
+    } finally {
+        await handle.close();
+    }
+    
+    return {
+        filename: backupFile,
+        created: new Date(stats.mtime).toISOString(),
+        size: stats.size,
+        backup_type: backupData.backup_type || 'manual',
+        includes_tabs: backupData.tabs?.length || 0,
+        includes_services: backupData.services ? Object.values(backupData.services).reduce((sum, services) => sum + services.length, 0) : 0,
+        service_urls: backupData.service_urls || [],
+        comment: backupData.comment || ''
+    };
+}
+
 app.get('/api/backups', async (req, res) => {
     try {
         const allFiles = await fs.readdir('.');
@@ -710,21 +969,16 @@ app.get('/api/backups', async (req, res) => {
         
         console.log('Found backup files:', backupFiles);
         
+        // Read backups a batch at a time so a large backup directory can't
+        // exhaust file descriptors
         const backups = [];
-        for (const backupFile of backupFiles) {
-            const stats = await fs.stat(backupFile);
-            const backupData = JSON.parse(await fs.readFile(backupFile, 'utf8'));
-            
-            backups.push({
-                filename: backupFile,
-                created: new Date(stats.mtime).toISOString(),
-                size: stats.size,
-                backup_type: backupData.backup_type || 'manual',
-                includes_tabs: backupData.tabs?.length || 0,
-                includes_services: backupData.services ? Object.values(backupData.services).reduce((sum, services) => sum + services.length, 0) : 0,
-                service_urls: backupData.service_urls || [],
-                comment: backupData.comment || ''
-            });
+        for (let i = 0; i < backupFiles.length; i += BACKUP_READ_BATCH_SIZE) {
+            const batch = backupFiles.slice(i, i + BACKUP_READ_BATCH_SIZE);
+            for (const backup of await Promise.all(batch.map(readBackupSummary))) {
+                if (backup) {
+                    backups.push(backup);
+                }
+            }
         }
         
         console.log('Processed backups:', backups);
@@ -748,17 +1002,11 @@ app.post('/api/restore/:filename', async (req, res) => {
         
         // Validate filename to prevent directory traversal
         if (!filename.startsWith('homelab_backup_') || !filename.endsWith('.json')) {
-            return res.status(400).json({
-                success: false,
-                error: 'Invalid backup filename'
-            });
+            return sendInvalidBackupFilename(res);
         }
         
         if (!fsSync.existsSync(filename)) {
-            return res.status(404).json({
-                success: false,
-                error: 'Backup file not found'
-            });
+            return sendBackupNotFound(res);
         }
         
         const backupData = JSON.parse(await fs.readFile(filename, 'utf8'));
@@ -810,17 +1058,11 @@ app.get('/api/download/:filename', async (req, res) => {
         
         // Validate filename to prevent directory traversal
         if (!filename.startsWith('homelab_backup_') || !filename.endsWith('.json')) {
-            return res.status(400).json({
-                success: false,
-                error: 'Invalid backup filename'
-            });
+            return sendInvalidBackupFilename(res);
         }
         
         if (!fsSync.existsSync(filename)) {
-            return res.status(404).json({
-                success: false,
-                error: 'Backup file not found'
-            });
+            return sendBackupNotFound(res);
         }
         
         res.download(filename, filename);
@@ -832,7 +1074,9 @@ app.get('/api/download/:filename', async (req, res) => {
     }
 });
 
-app.post('/api/export/download', async (req, res) => {
+// The dashboard submits this one as a hidden form, so it is the only route
+// that needs the urlencoded body parser
+app.post('/api/export/download', express.urlencoded({ extended: true }), async (req, res) => {
     try {
         console.log('Request body:', req.body);
         console.log('Content-Type:', req.get('Content-Type'));
@@ -897,24 +1141,18 @@ app.post('/api/backup/:filename/comment', async (req, res) => {
         const { comment } = req.body;
         
         if (!filename.startsWith('homelab_backup_') || !filename.endsWith('.json')) {
-            return res.status(400).json({
-                success: false,
-                error: 'Invalid backup filename'
-            });
+            return sendInvalidBackupFilename(res);
         }
         
         if (!fsSync.existsSync(filename)) {
-            return res.status(404).json({
-                success: false,
-                error: 'Backup file not found'
-            });
+            return sendBackupNotFound(res);
         }
         
         const backupData = JSON.parse(await fs.readFile(filename, 'utf8'));
         backupData.comment = comment;
         backupData.last_modified = new Date().toISOString();
         
-        await fs.writeFile(filename, JSON.stringify(backupData, null, 2));
+        await writeJsonFile(filename, backupData, { pretty: true });
         
         res.json({
             success: true,
@@ -935,10 +1173,7 @@ app.put('/api/backup/:filename', async (req, res) => {
         const { newFilename } = req.body;
         
         if (!oldFilename.startsWith('homelab_backup_') || !oldFilename.endsWith('.json')) {
-            return res.status(400).json({
-                success: false,
-                error: 'Invalid backup filename'
-            });
+            return sendInvalidBackupFilename(res);
         }
         
         if (!newFilename || typeof newFilename !== 'string') {
@@ -958,10 +1193,7 @@ app.put('/api/backup/:filename', async (req, res) => {
         }
         
         if (!fsSync.existsSync(oldFilename)) {
-            return res.status(404).json({
-                success: false,
-                error: 'Backup file not found'
-            });
+            return sendBackupNotFound(res);
         }
         
         if (fsSync.existsSync(finalNewFilename)) {
@@ -993,17 +1225,11 @@ app.delete('/api/backup/:filename', async (req, res) => {
         const filename = req.params.filename;
         
         if (!filename.startsWith('homelab_backup_') || !filename.endsWith('.json')) {
-            return res.status(400).json({
-                success: false,
-                error: 'Invalid backup filename'
-            });
+            return sendInvalidBackupFilename(res);
         }
         
         if (!fsSync.existsSync(filename)) {
-            return res.status(404).json({
-                success: false,
-                error: 'Backup file not found'
-            });
+            return sendBackupNotFound(res);
         }
         
         await fs.unlink(filename);
@@ -1037,22 +1263,12 @@ app.get('/api/debug/files', async (req, res) => {
     }
 });
 
-app.get('/favicon.ico', (req, res) => {
-    res.sendFile(path.join(__dirname, 'static', 'favicon.svg'));
-});
-
 app.use((req, res) => {
-    res.status(404).json({
-        success: false,
-        error: 'Endpoint not found'
-    });
+    sendEndpointNotFound(res);
 });
 
 app.use((err, req, res, next) => {
-    res.status(500).json({
-        success: false,
-        error: 'Internal server error'
-    });
+    sendInternalError(res);
 });
 
 // Initialize default files
@@ -1063,7 +1279,7 @@ function initializeDefaultFiles() {
             fsSync.writeFileSync(CONFIG_FILE, JSON.stringify({
                 services: DEFAULT_SERVICES,
                 last_updated: new Date().toISOString()
-            }, null, 2));
+            }));
             console.log(`Created default config file: ${CONFIG_FILE}`);
         }
         
@@ -1072,7 +1288,7 @@ function initializeDefaultFiles() {
             fsSync.writeFileSync(TABS_CONFIG_FILE, JSON.stringify({
                 tabs: DEFAULT_TABS,
                 last_updated: new Date().toISOString()
-            }, null, 2));
+            }));
             console.log(`Created default tabs config: ${TABS_CONFIG_FILE}`);
         }
         
@@ -1093,14 +1309,101 @@ function initializeDefaultFiles() {
 }
 
 const PORT = process.env.PORT || 80;
+// Number of processes serving PORT. Workers only share state through the
+// config files: each re-reads a file once it has been replaced (see
+// fileVersion), and deletes and reorders are written straight through instead
+// of debounced.
+const WORKERS = parseInt(process.env.WEB_CONCURRENCY, 10) || 1;
+// Restarting crashed workers waits a bit; workers that die before they start
+// listening (e.g. EACCES or EADDRINUSE on PORT) too many times in a row stop
+// the whole server instead of being re-forked forever.
+const WORKER_RESTART_DELAY_MS = 1000;
+const MAX_WORKER_STARTUP_FAILURES = 5;
 
-// Initialize default files and start server
-if (initializeDefaultFiles()) {
+function startServer() {
     app.listen(PORT, '0.0.0.0', () => {
-        console.log(`Server running on port ${PORT}`);
+        console.log(`Server running on port ${PORT}${cluster.isWorker ? ` (worker ${process.pid})` : ''}`);
         console.log(`IP whitelist: ${ipWhitelist.join(', ')}`);
     });
-} else {
+    
+    // Write out any debounced edits before exiting
+    for (const signal of ['SIGINT', 'SIGTERM']) {
+        process.on(signal, () => {
+            flushPendingServices().finally(() => process.exit(0));
+        });
+    }
+}
+
+function startWorkers() {
+    let shuttingDown = false;
+    let exitCode = 0;
+    let running = 0;
+    let startupFailures = 0;
+    const listening = new Set();
+    
+    const fork = () => {
+        running++;
+        cluster.fork();
+    };
+    
+    const shutdown = () => {
+        shuttingDown = true;
+        if (running === 0) {
+            process.exit(exitCode);
+        }
+        for (const worker of Object.values(cluster.workers)) {
+            worker.process.kill('SIGTERM');
+        }
+    };
+    
+    cluster.on('listening', worker => {
+        listening.add(worker.id);
+        startupFailures = 0;
+    });
+    
+    cluster.on('exit', (worker, code, signal) => {
+        running--;
+        const started = listening.delete(worker.id);
+        if (shuttingDown) {
+            if (running === 0) {
+                process.exit(exitCode);
+            }
+            return;
+        }
+        
+        if (!started && ++startupFailures >= MAX_WORKER_STARTUP_FAILURES) {
+            console.error(`Workers failed to start ${startupFailures} times in a row. Exiting.`);
+            exitCode = 1;
+            shutdown();
+            return;
+        }
+        
+        console.warn(`Worker ${worker.process.pid} exited (${signal || code}), restarting`);
+        setTimeout(() => {
+            if (!shuttingDown) {
+                fork();
+            }
+        }, WORKER_RESTART_DELAY_MS);
+    });
+    
+    // Let each worker flush its pending edits, then exit once they are all gone
+    for (const signal of ['SIGINT', 'SIGTERM']) {
+        process.on(signal, shutdown);
+    }
+    
+    for (let i = 0; i < WORKERS; i++) {
+        fork();
+    }
+}
+
+// Initialize default files and start server
+if (cluster.isWorker) {
+    startServer();
+} else if (!initializeDefaultFiles()) {
     console.error('Failed to initialize server. Exiting.');
     process.exit(1);
+} else if (WORKERS > 1) {
+    startWorkers();
+} else {
+    startServer();
 }
\ No newline at end of file